@@ -1,7 +1,67 @@
+from functools import lru_cache
+from itertools import chain
 from math import gcd
+from operator import add
+import re
 import string
 
+# --- Translation Tables ---
+_ASCII_LETTERS = string.ascii_letters.encode('ascii')
+_NON_ALPHA = re.compile(r'[^A-Za-z]')
+_LETTER_RUN = re.compile(r'[A-Za-z]+')
+
+
+def _substitution_table(lower_alphabet):
+    """
+    Builds a 256-byte translation table mapping 'a'-'z' onto 'lower_alphabet'
+    and 'A'-'Z' onto its uppercase form. All other bytes map to themselves.
+    """
+    return bytes.maketrans(_ASCII_LETTERS, (lower_alphabet + lower_alphabet.upper()).encode('ascii'))
+
+
+def _shifted_alphabet(shift):
+    """
+    Returns the lowercase alphabet rotated left by 'shift' positions.
+    """
+    shift %= 26
+    return string.ascii_lowercase[shift:] + string.ascii_lowercase[:shift]
+
+
+def _translate(text, table):
+    """
+    Applies a substitution table to text with bytes.translate.
+    Multi-byte UTF-8 sequences never contain ASCII letters, so they pass through unchanged;
+    'surrogatepass' lets lone surrogates (e.g. from surrogateescape input) through as well.
+    """
+    return text.encode('utf-8', 'surrogatepass').translate(table).decode('utf-8', 'surrogatepass')
+
+
 # --- Additive Cipher ---
+@lru_cache(maxsize=None)
+def _additive_table(shift):
+    """
+    Returns the translation table shifting letters forward by 'shift' positions.
+    There are only 26 distinct tables, so every one is cached after first use.
+    """
+    return _substitution_table(_shifted_alphabet(shift))
+
+
+def additive_cipher_factory(key, mode='encrypt'):
+    """
+    Returns a function that encrypts or decrypts text with a fixed Additive Cipher key.
+    The key is validated and the translation table built once, so repeated
+    calls on many texts only pay for the translation itself.
+    """
+    if not isinstance(key, int):
+        raise ValueError("Key must be an integer.")
+
+    table = _additive_table((key if mode == 'encrypt' else -key) % 26)
+
+    def cipher(text):
+        return _translate(text, table)
+    return cipher
+
+
 def additive_cipher(text, key, mode='encrypt'):
     """
     Encrypts or decrypts the text using the Additive Cipher.
@@ -9,19 +69,7 @@ def additive_cipher(text, key, mode='encrypt'):
     For decryption, shifts backwards by 'key' positions.
     Handles non-alphabetic characters and ensures key is an integer.
     """
-    if not isinstance(key, int):
-        raise ValueError("Key must be an integer.")
-    
-    shift = key if mode == 'encrypt' else -key
-    encrypted_text = ''
-    
-    for char in text:
-        if char.isalpha():
-            shifted_char = chr((ord(char.lower()) - 97 + shift) % 26 + 97)
-            encrypted_text += shifted_char.upper() if char.isupper() else shifted_char
-        else:
-            encrypted_text += char  # Non-alphabetic characters are unchanged
-    return encrypted_text
+    return additive_cipher_factory(key, mode)(text)
 
 def additive_cipher_decrypt(text, key):
     """
@@ -30,8 +78,50 @@ def additive_cipher_decrypt(text, key):
     """
     return additive_cipher(text, key, mode='decrypt')
 
+def additive_cipher_batch(texts, key, mode='encrypt'):
+    """
+    Encrypts or decrypts a list of texts with the same Additive Cipher key.
+    The texts are joined and translated in a single call, then split apart again.
+    """
+    texts = list(texts)  # Read twice below, so a generator must not be consumed by the join
+    joined = additive_cipher(''.join(texts), key, mode)
+    results = []
+    start = 0
+    for text in texts:
+        results.append(joined[start:start + len(text)])
+        start += len(text)
+    return results
+
 
 # --- Multiplicative Cipher ---
+@lru_cache(maxsize=None)
+def _affine_table(a, b):
+    """
+    Returns the translation table mapping letter position i to (a * i + b) % 26.
+    Shared by the Multiplicative (b = 0) and Affine Ciphers and cached per key pair.
+    """
+    return _substitution_table(''.join(chr((a * i + b) % 26 + 97) for i in range(26)))
+
+
+def multiplicative_cipher_factory(key, mode='encrypt'):
+    """
+    Returns a function that encrypts or decrypts text with a fixed Multiplicative Cipher key.
+    The key is validated and the translation table built once, up front.
+    """
+    if not isinstance(key, int):
+        raise ValueError("Key must be an integer.")
+    if gcd(key, 26) != 1:
+        raise ValueError("Key must be coprime with 26.")
+
+    # Decryption multiplies by the modular inverse
+    factor = key if mode == 'encrypt' else pow(key, -1, 26)
+    table = _affine_table(factor % 26, 0)
+
+    def cipher(text):
+        return _translate(text, table)
+    return cipher
+
+
 def multiplicative_cipher(text, key, mode='encrypt'):
     """
     Encrypts or decrypts text using the Multiplicative Cipher.
@@ -39,24 +129,7 @@ def multiplicative_cipher(text, key, mode='encrypt'):
     Decryption reverses this using the modular inverse of 'key'.
     Handles invalid keys (not coprime with 26) and non-alphabetic characters.
     """
-    from math import gcd
-
-    if gcd(key, 26) != 1:
-        raise ValueError("Key must be coprime with 26.")
-    if not isinstance(key, int):
-        raise ValueError("Key must be an integer.")
-
-    encrypted_text = ''
-    
-    for char in text:
-        if char.isalpha():
-            pos = (ord(char.lower()) - 97)
-            new_pos = (key * pos) % 26 if mode == 'encrypt' else (pow(key, -1, 26) * pos) % 26
-            encrypted_char = chr(new_pos + 97)
-            encrypted_text += encrypted_char.upper() if char.isupper() else encrypted_char
-        else:
-            encrypted_text += char
-    return encrypted_text
+    return multiplicative_cipher_factory(key, mode)(text)
 
 def multiplicative_cipher_decrypt(text, key):
     """
@@ -67,28 +140,35 @@ def multiplicative_cipher_decrypt(text, key):
 
 
 # --- Affine Cipher ---
-def affine_cipher(text, a, b, mode='encrypt'):
+def affine_cipher_factory(a, b, mode='encrypt'):
     """
-    Encrypts or decrypts text using the Affine Cipher.
-    Uses two keys: 'a' (multiplicative) and 'b' (additive).
-    Validates keys to ensure 'a' is coprime with 26.
+    Returns a function that encrypts or decrypts text with fixed Affine Cipher keys.
+    The keys are validated and the translation table built once, up front.
     """
     if not isinstance(a, int) or not isinstance(b, int):
         raise ValueError("Both keys must be integers.")
     if gcd(a, 26) != 1:
         raise ValueError("1st Key  must be coprime with 26.")
 
-    encrypted_text = ''
-    
-    for char in text:
-        if char.isalpha():
-            pos = ord(char.lower()) - 97
-            new_pos = (a * pos + b) % 26 if mode == 'encrypt' else (pow(a, -1, 26) * (pos - b)) % 26
-            encrypted_char = chr(new_pos + 97)
-            encrypted_text += encrypted_char.upper() if char.isupper() else encrypted_char
-        else:
-            encrypted_text += char
-    return encrypted_text
+    if mode == 'encrypt':
+        table = _affine_table(a % 26, b % 26)
+    else:
+        # inv * (i - b) == inv * i - inv * b
+        inv = pow(a, -1, 26)
+        table = _affine_table(inv, (-inv * b) % 26)
+
+    def cipher(text):
+        return _translate(text, table)
+    return cipher
+
+
+def affine_cipher(text, a, b, mode='encrypt'):
+    """
+    Encrypts or decrypts text using the Affine Cipher.
+    Uses two keys: 'a' (multiplicative) and 'b' (additive).
+    Validates keys to ensure 'a' is coprime with 26.
+    """
+    return affine_cipher_factory(a, b, mode)(text)
 
 def affine_cipher_decrypt(text, a, b):
     """
@@ -106,24 +186,17 @@ def monoalphabetic_cipher(text, substitution_key, mode='encrypt'):
     Decryption uses the reverse mapping.
     Handles non-alphabetic characters.
     """
-    if len(substitution_key) != 26 or not substitution_key.isalpha():
+    if len(substitution_key) != 26 or not (substitution_key.isascii() and substitution_key.isalpha()):
         raise ValueError("Substitution key must be a string of 26 alphabetic characters.")
 
-    alphabet = string.ascii_lowercase
-    
+    substitution_key = substitution_key.lower()
     if mode == 'decrypt':
-        substitution_key = ''.join(sorted(substitution_key, key=substitution_key.index))
+        # Map the key letters back onto the alphabet
+        table = bytes.maketrans((substitution_key + substitution_key.upper()).encode('ascii'), _ASCII_LETTERS)
+    else:
+        table = _substitution_table(substitution_key)
 
-    encrypted_text = ''
-    
-    for char in text:
-        if char.isalpha():
-            index = alphabet.index(char.lower())
-            new_char = substitution_key[index]
-            encrypted_text += new_char.upper() if char.isupper() else new_char
-        else:
-            encrypted_text += char
-    return encrypted_text
+    return _translate(text, table)
 
 def monoalphabetic_cipher_decrypt(text, substitution_key):
     """
@@ -134,42 +207,71 @@ def monoalphabetic_cipher_decrypt(text, substitution_key):
 
 
 # --- Autokey Cipher ---
+def _autokey_encrypt_table():
+    """
+    Builds the Autokey lookup from a two-character string (plaintext letter +
+    key letter) to the ciphertext letter, for every pair of ASCII letters.
+    The key letter's case is ignored; the plaintext letter's case is kept.
+    """
+    table = {}
+    for key_char in string.ascii_letters:
+        shifted = _shifted_alphabet(ord(key_char.lower()) - 97)
+        for char, encrypted_char in zip(string.ascii_letters, shifted + shifted.upper()):
+            table[char + key_char] = encrypted_char
+    return table
+
+
+_AUTOKEY_ENCRYPT_TABLE = _autokey_encrypt_table()
+
+
 def autokey_cipher(text, keyword, mode='encrypt'):
     """
     Encrypts or decrypts text using the Autokey Cipher.
     For encryption, extends the keyword with the plaintext.
     Decryption reconstructs the key from the ciphertext.
+    The key advances only on letters; other characters are unchanged.
     """
-    if not keyword.isalpha():
+    if not (keyword.isascii() and keyword.isalpha()):
         raise ValueError("Keyword must be alphabetic.")
 
     keyword = keyword.lower()
     
     if mode == 'decrypt':
-        extended_key = keyword
-        decrypted_text = ''
+        # Each recovered letter extends the key, so this stays sequential;
+        # work on byte codes to keep the loop body to integer arithmetic.
+        # The key advances only on letters, exactly as in encryption, and
+        # non-ASCII characters (never ASCII letters in UTF-8) pass through
+        extended_key = [ord(k) for k in keyword]
+        data = text.encode('utf-8', 'surrogatepass')
+        out = bytearray(data)
+        letter_index = 0
         
-        for i, char in enumerate(text):
-            if char.isalpha():
-                pos = (ord(char.lower()) - ord(extended_key[i])) % 26
-                decrypted_char = chr(pos + 97)
-                extended_key += decrypted_char
-                decrypted_text += decrypted_char.upper() if char.isupper() else decrypted_char
-            else:
-                decrypted_text += char
-        return decrypted_text
-
-    extended_key = (keyword + text).lower()[:len(text)]
-    encrypted_text = ''
-    
-    for i in range(len(text)):
-        if text[i].isalpha():
-            pos = (ord(text[i].lower()) - 97 + ord(extended_key[i]) - 97) % 26
-            encrypted_char = chr(pos + 97)
-            encrypted_text += encrypted_char.upper() if text[i].isupper() else encrypted_char
-        else:
-            encrypted_text += text[i]
-    return encrypted_text
+        for i, code in enumerate(data):
+            lower = code | 0x20  # Lowercases 'A'-'Z'; only letters land in 'a'-'z'
+            if 97 <= lower <= 122:
+                plain = (lower - extended_key[letter_index]) % 26 + 97
+                extended_key.append(plain)
+                letter_index += 1
+                out[i] = plain ^ (code ^ lower)  # Clear bit 0x20 again for uppercase
+        return out.decode('utf-8', 'surrogatepass')
+
+    # The key is the keyword followed by the plaintext letters, so it is known
+    # up front and every letter can be encrypted in one pass; map() stops at
+    # the last letter, so the key is never materialised
+    letters = _NON_ALPHA.sub('', text)
+    pairs = map(add, letters, chain(keyword, letters))
+    encrypted = ''.join(map(_AUTOKEY_ENCRYPT_TABLE.__getitem__, pairs))
+    if len(letters) == len(text):
+        return encrypted
+
+    # Put the encrypted letters back between the unchanged non-letters
+    offset = 0
+
+    def refill(match):
+        nonlocal offset
+        start, offset = offset, offset + len(match.group())
+        return encrypted[start:offset]
+    return _LETTER_RUN.sub(refill, text)
 
 def autokey_cipher_decrypt(text, keyword):
     """
@@ -190,17 +292,20 @@ def vigenere_cipher(text, keyword, mode='encrypt'):
         raise ValueError("Keyword must be alphabetic.")
         
     keyword = keyword.lower()
-    keyword_repeated = (keyword * (len(text) // len(keyword) + 1))[:len(text)]
-    encrypted_text = ''
-    
-    for i in range(len(text)):
-        if text[i].isalpha():
-            pos = (ord(text[i].lower()) - 97 + ord(keyword_repeated[i]) - 97) % 26 if mode == 'encrypt' else (ord(text[i].lower()) - ord(keyword_repeated[i])) % 26
-            encrypted_char = chr(pos + 97)
-            encrypted_text += encrypted_char.upper() if text[i].isupper() else encrypted_char
-        else:
-            encrypted_text += text[i]
-    return encrypted_text
+    sign = 1 if mode == 'encrypt' else -1
+
+    # ASCII text is shifted as raw bytes; anything else is sliced as str so
+    # key phases stay aligned with characters rather than UTF-8 bytes
+    is_ascii = text.isascii()
+    data = text.encode('ascii') if is_ascii else text
+    out = bytearray(data) if is_ascii else list(text)
+
+    # Every k-th character shares a key letter, so each phase is a plain shift
+    key_length = len(keyword)
+    for phase, key_char in enumerate(keyword):
+        table = _additive_table(sign * (ord(key_char) - 97) % 26)
+        out[phase::key_length] = data[phase::key_length].translate(table)
+    return out.decode('ascii') if is_ascii else ''.join(out)
 
 def vigenere_cipher_decrypt(text, keyword):
     """
@@ -209,6 +314,27 @@ def vigenere_cipher_decrypt(text, keyword):
     """
     return vigenere_cipher(text, keyword, mode='decrypt')
 
+def vigenere_cipher_batch(texts, keyword, mode='encrypt'):
+    """
+    Encrypts or decrypts a list of texts with the same Vigenère keyword.
+    Each text is padded to a multiple of the keyword length so the keyword
+    restarts at every text, and the whole batch is ciphered in one call.
+    """
+    if not keyword.isalpha():
+        raise ValueError("Keyword must be alphabetic.")
+
+    texts = list(texts)  # Read twice below, so a generator must not be consumed by the join
+
+    # Padding is non-alphabetic, so it passes through and is sliced off again
+    padding = [-len(text) % len(keyword) for text in texts]
+    joined = vigenere_cipher(''.join(text + '\0' * pad for text, pad in zip(texts, padding)), keyword, mode)
+    results = []
+    start = 0
+    for text, pad in zip(texts, padding):
+        results.append(joined[start:start + len(text)])
+        start += len(text) + pad
+    return results
+
 
 # --- Keyless Transposition Cipher ---
 def keyless_transposition_cipher(text):
@@ -234,30 +360,39 @@ def keyless_transposition_cipher_decrypt(text):
 
 
 # --- Keyed Transposition Cipher ---
+@lru_cache(maxsize=256)
+def _cached_key_order(key, name):
+    """
+    Validates a transposition key given as a tuple and returns its column order.
+    Cached so every transposition variant pays for this once per key.
+    """
+    if not key or len(set(key)) != len(key):
+        raise ValueError(f"{name} must be a non-empty string of unique characters.")
+    return tuple(sorted(range(len(key)), key=key.__getitem__))
+
+
+def _key_order(key, name='Key'):
+    """
+    Validates a transposition key and returns its column order:
+    the column indices sorted by their key character.
+    The key is cached by its tuple form, so any sequence (e.g. a list) is accepted.
+    """
+    return _cached_key_order(tuple(key) if key else (), name)
+
+
 def keyed_transposition_cipher(text, key):
     """
     Encrypts text using a Keyed Transposition Cipher.
     Rearranges characters based on the key order.
     Validates key and handles non-alphabetic characters.
     """
-    if not key or len(set(key)) != len(key):
-        raise ValueError("Key must be a non-empty string of unique characters.")
-    
-    # Create a list of the positions of the sorted key
+    # Validated positions of the sorted key
+    key_order = _key_order(key)
     key_length = len(key)
-    key_order = sorted(range(key_length), key=lambda k: key[k])
     
-    # Prepare a grid to store characters
-    grid = [''] * key_length
-    index = 0
-
-    # Fill the grid with characters from the text
-    for char in text:
-        grid[index % key_length] += char
-        index += 1
-
-    # Rearrange the grid based on the order of the key
-    encrypted_text = ''.join(grid[i] for i in key_order)
+    # Column i of the grid holds every key_length-th character starting at i,
+    # so read the columns straight out of the text in key order
+    encrypted_text = ''.join([text[i::key_length] for i in key_order])
     return encrypted_text
 
 
@@ -267,12 +402,9 @@ def keyed_transposition_cipher_decrypt(text, key):
     Rearranges characters based on the key order.
     Validates key.
     """
-    if not key or len(set(key)) != len(key):
-        raise ValueError("Key must be a non-empty string of unique characters.")
-    
-    # Create a list of the positions of the sorted key
+    # Validated positions of the sorted key
+    key_order = _key_order(key)
     key_length = len(key)
-    key_order = sorted(range(key_length), key=lambda k: key[k])
     
     # Calculate how many characters will go in each column
     num_full_columns = len(text) // key_length
@@ -281,42 +413,33 @@ def keyed_transposition_cipher_decrypt(text, key):
     # Calculate the number of characters in each column
     column_lengths = [num_full_columns + (1 if i < num_short_columns else 0) for i in range(key_length)]
     
-    # Create the grid for decryption
-    grid = [''] * key_length
+    decrypted = [''] * len(text)
     index = 0
     
-    # Fill the grid according to the column lengths
+    # Column col holds the characters at positions col, col + key_length, ...
+    # so scatter each slice of the ciphertext straight back to those positions
     for col in key_order:
-        for _ in range(column_lengths[col]):
-            grid[col] += text[index]
-            index += 1
+        decrypted[col::key_length] = text[index:index + column_lengths[col]]
+        index += column_lengths[col]
             
-    # Read the grid column-wise to get the decrypted text
-    decrypted_text = ''.join(''.join(grid[i]) for i in range(key_length))
-    return decrypted_text
+    return ''.join(decrypted)
 def combined_keyless_keyed_transposition_cipher(text, key):
     """
     Encrypts text using a combination of Keyless and Keyed Transposition.
     First rearranges the text using Keyless Transposition, then applies Keyed Transposition.
     Validates key.
     """
-    if not key or len(set(key)) != len(key):
-        raise ValueError("Key must be a non-empty string of unique characters.")
+    key_order = _key_order(key)
+    key_length = len(key)
 
-    # Keyless Transposition: Rearrange text by swapping halves
+    # Keyless Transposition swaps the halves, so position i of the swapped text
+    # is text[i + mid] before 'wrap' and text[i - wrap] from 'wrap' onwards
     mid = len(text) // 2
-    keyless_transposed_text = text[mid:] + text[:mid]
-    
-    # Keyed Transposition: Rearranging using the key
-    key_length = len(key)
-    key_order = sorted(range(key_length), key=lambda k: key[k])
-    
-    grid = [''] * key_length
-    index = 0
+    wrap = len(text) - mid
 
-    for char in keyless_transposed_text:
-        grid[index % key_length] += char
-        index += 1
+    # Keyed Transposition: read each column straight out of the original text
+    grid = [text[col + mid::key_length] + text[(col - wrap) % key_length:mid:key_length]
+            for col in range(key_length)]
 
     # Rearranging the grid based on the key order
     encrypted_text = ''.join(grid[i] for i in key_order)
@@ -329,34 +452,28 @@ def combined_keyless_keyed_transposition_cipher_decrypt(text, key):
     Reverses the process of the combined Keyless and Keyed Transposition Cipher.
     Validates key.
     """
-    if not key or len(set(key)) != len(key):
-        raise ValueError("Key must be a non-empty string of unique characters.")
-
-    # Keyed Transposition: Reconstruct the grid
+    key_order = _key_order(key)
     key_length = len(key)
-    key_order = sorted(range(key_length), key=lambda k: key[k])
-    
+
     num_full_columns = len(text) // key_length
     num_short_columns = len(text) % key_length
     column_lengths = [num_full_columns + (1 if i < num_short_columns else 0) for i in range(key_length)]
-    
-    grid = [''] * key_length
+
+    mid = len(text) // 2
+    wrap = len(text) - mid
+    decrypted = [''] * len(text)
     index = 0
 
-    # Fill the grid according to the column lengths
+    # Scatter each column back to its original positions, undoing both
+    # transpositions in one step (see the encryption for the index mapping)
     for col in key_order:
-        for _ in range(column_lengths[col]):
-            grid[col] += text[index]
-            index += 1
-            
-    # Read the grid column-wise to get the intermediate text
-    intermediate_text = ''.join(''.join(grid[i]) for i in range(key_length))
-    
-    # Keyless Transposition: Reverse the swapping of halves
-    mid = len(intermediate_text) // 2
-    decrypted_text = intermediate_text[mid:] + intermediate_text[:mid]
-    
-    return decrypted_text
+        column = text[index:index + column_lengths[col]]
+        index += column_lengths[col]
+        head = len(range(col + mid, len(text), key_length))
+        decrypted[col + mid::key_length] = column[:head]
+        decrypted[(col - wrap) % key_length:mid:key_length] = column[head:]
+
+    return ''.join(decrypted)
 
 def double_transposition_cipher(text, key1, key2):
     """
@@ -364,10 +481,8 @@ def double_transposition_cipher(text, key1, key2):
     Applies two rounds of transposition using two different keys.
     Validates both keys.
     """
-    if not key1 or len(set(key1)) != len(key1):
-        raise ValueError("First key must be a non-empty string of unique characters.")
-    if not key2 or len(set(key2)) != len(key2):
-        raise ValueError("Second key must be a non-empty string of unique characters.")
+    _key_order(key1, 'First key')
+    _key_order(key2, 'Second key')
 
     # First Transposition using key1
     first_encrypted_text = keyed_transposition_cipher(text, key1)
@@ -384,10 +499,8 @@ def double_transposition_cipher_decrypt(text, key1, key2):
     Reverses the process by applying two rounds of decryption.
     Validates both keys.
     """
-    if not key1 or len(set(key1)) != len(key1):
-        raise ValueError("First key must be a non-empty string of unique characters.")
-    if not key2 or len(set(key2)) != len(key2):
-        raise ValueError("Second key must be a non-empty string of unique characters.")
+    _key_order(key1, 'First key')
+    _key_order(key2, 'Second key')
 
     # First Decryption using key2
     first_decrypted_text = keyed_transposition_cipher_decrypt(text, key2)
@@ -407,9 +520,9 @@ def create_playfair_matrix(key):
     matrix = []
     seen = set()
 
-    # Add unique letters from the key to the matrix
+    # Add unique letters from the key to the matrix (only A-Z have a cell)
     for char in key:
-        if char not in seen and char.isalpha():
+        if char not in seen and char in string.ascii_uppercase:
             seen.add(char)
             matrix.append(char)
 
@@ -424,32 +537,68 @@ def create_playfair_matrix(key):
     return [matrix[i:i + 5] for i in range(0, 25, 5)]
 
 
+def create_playfair_positions(matrix):
+    """
+    Map each letter of a Playfair matrix to its (row, column) position.
+    Lets the cipher locate a letter with one dict lookup instead of scanning the matrix.
+    """
+    return {letter: (row, col) for row, letters in enumerate(matrix) for col, letter in enumerate(letters)}
+
+
+@lru_cache(maxsize=128)
+def _playfair_tables(key):
+    """
+    Returns the Playfair encryption and decryption tables for 'key'.
+    Every digraph of matrix letters is mapped to its result up front, so the
+    cipher does one dict lookup per digraph instead of row/column arithmetic.
+    Cached so repeated calls with the same key skip rebuilding them.
+    """
+    matrix = create_playfair_matrix(key)
+    positions = create_playfair_positions(matrix)
+    encrypt_table = {}
+
+    for char1, (row1, col1) in positions.items():
+        for char2, (row2, col2) in positions.items():
+            if row1 == row2:  # Same row
+                digraph = matrix[row1][(col1 + 1) % 5] + matrix[row2][(col2 + 1) % 5]
+            elif col1 == col2:  # Same column
+                digraph = matrix[(row1 + 1) % 5][col1] + matrix[(row2 + 1) % 5][col2]
+            else:  # Rectangle swap
+                digraph = matrix[row1][col2] + matrix[row2][col1]
+            encrypt_table[char1 + char2] = digraph
+
+    # Each rule is reversible, so decryption is the inverse mapping
+    decrypt_table = {digraph: pair for pair, digraph in encrypt_table.items()}
+    return encrypt_table, decrypt_table
+
+
+_DIGRAPH = re.compile(r'(.)((?!\1).)?')
+
+
 def format_plaintext(plaintext):
     """
     Prepare the plaintext for Playfair Cipher encryption.
     It removes non-alphabetic characters and formats it by inserting 'X' between identical letters.
     If the length is odd, adds an 'X' at the end.
     """
-    plaintext = plaintext.upper().replace('J', 'I')
-    formatted = ""
-
-    # Create digraphs
-    i = 0
-    while i < len(plaintext):
-        char1 = plaintext[i]
-        if i + 1 < len(plaintext):
-            char2 = plaintext[i + 1]
-            if char1 == char2:  # If identical letters, insert 'X'
-                formatted += char1 + 'X'
-                i += 1
-            else:
-                formatted += char1 + char2
-                i += 2
-        else:
-            formatted += char1 + 'X'  # Add 'X' if last character is alone
-            i += 1
+    plaintext = _NON_ALPHA.sub('', plaintext).upper().replace('J', 'I')
 
-    return formatted
+    # Each match is a digraph, or a lone letter when the next one is identical
+    # or missing; lone letters are padded with 'X'
+    return _DIGRAPH.sub(lambda m: m.group(1) + (m.group(2) or 'X'), plaintext)
+
+
+def _playfair_apply(text, table):
+    """
+    Replaces each digraph of 'text' using a table from _playfair_tables.
+    Pairs are formed and looked up with map(), so there is no per-digraph Python code.
+    """
+    if len(text) % 2:
+        raise ValueError("Playfair text must have an even number of letters.")
+    try:
+        return ''.join(map(table.__getitem__, map(add, text[0::2], text[1::2])))
+    except KeyError:
+        raise ValueError("Playfair text must contain only the letters A-Z.") from None
 
 
 def playfair_encrypt(plaintext, key):
@@ -457,27 +606,8 @@ def playfair_encrypt(plaintext, key):
     Encrypts plaintext using the Playfair Cipher.
     The plaintext is processed and then encrypted using the generated matrix.
     """
-    matrix = create_playfair_matrix(key)
-    formatted_text = format_plaintext(plaintext)
-    ciphertext = ""
-
-    for i in range(0, len(formatted_text), 2):
-        char1 = formatted_text[i]
-        char2 = formatted_text[i + 1]
-        row1, col1 = divmod(matrix.index(char1), 5)
-        row2, col2 = divmod(matrix.index(char2), 5)
-
-        if row1 == row2:  # Same row
-            ciphertext += matrix[row1][(col1 + 1) % 5]
-            ciphertext += matrix[row2][(col2 + 1) % 5]
-        elif col1 == col2:  # Same column
-            ciphertext += matrix[(row1 + 1) % 5][col1]
-            ciphertext += matrix[(row2 + 1) % 5][col2]
-        else:  # Rectangle swap
-            ciphertext += matrix[row1][col2]
-            ciphertext += matrix[row2][col1]
-
-    return ciphertext
+    encrypt_table, _ = _playfair_tables(key)
+    return _playfair_apply(format_plaintext(plaintext), encrypt_table)
 
 
 def playfair_decrypt(ciphertext, key):
@@ -485,27 +615,8 @@ def playfair_decrypt(ciphertext, key):
     Decrypts ciphertext using the Playfair Cipher.
     The ciphertext is processed and then decrypted using the generated matrix.
     """
-    matrix = create_playfair_matrix(key)
-    formatted_text = ciphertext
-    plaintext = ""
-
-    for i in range(0, len(formatted_text), 2):
-        char1 = formatted_text[i]
-        char2 = formatted_text[i + 1]
-        row1, col1 = divmod(matrix.index(char1), 5)
-        row2, col2 = divmod(matrix.index(char2), 5)
-
-        if row1 == row2:  # Same row
-            plaintext += matrix[row1][(col1 - 1) % 5]
-            plaintext += matrix[row2][(col2 - 1) % 5]
-        elif col1 == col2:  # Same column
-            plaintext += matrix[(row1 - 1) % 5][col1]
-            plaintext += matrix[(row2 - 1) % 5][col2]
-        else:  # Rectangle swap
-            plaintext += matrix[row1][col2]
-            plaintext += matrix[row2][col1]
-
-    return plaintext
+    _, decrypt_table = _playfair_tables(key)
+    return _playfair_apply(ciphertext.upper().replace('J', 'I'), decrypt_table)
 
 def display_menu():
     """